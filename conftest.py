@@ -0,0 +1,35 @@
+"""
+pytest hooks for the parallel entry point (pytest test_optipenn_app.py -n auto).
+
+The Optipenn server is started and stopped once, by the controller process, so it
+outlives every xdist worker; workers only wait for it (see the `tester` fixture).
+"""
+
+_server_tester = None
+
+def _is_worker(config) -> bool:
+    return hasattr(config, "workerinput")
+
+def _runs_tests(config) -> bool:
+    """False for sessions that only list things (--collect-only, --fixtures, ...)"""
+    option = config.option
+    return not any(getattr(option, name, False) for name in ("collectonly", "showfixtures", "show_fixtures_per_test"))
+
+def pytest_sessionstart(session):
+    global _server_tester
+    if _is_worker(session.config) or not _runs_tests(session.config):
+        return
+    import pytest
+    from test_optipenn_app import OptipennTester
+    _server_tester = OptipennTester()
+    if not _server_tester.start_application():
+        _server_tester.cleanup()
+        _server_tester = None
+        pytest.exit("Failed to start application", returncode=1)
+
+def pytest_sessionfinish(session, exitstatus):
+    global _server_tester
+    if _is_worker(session.config) or _server_tester is None:
+        return
+    tester, _server_tester = _server_tester, None
+    tester.cleanup()
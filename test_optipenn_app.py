@@ -20,50 +20,74 @@ Features:
 Requirements:
 - Python 3.8+
 - selenium
-- pillow (for image processing)
 - requests (for API testing)
-- psutil (for performance monitoring)
 
 Usage:
     python test_optipenn_app.py [--module MODULE_NAME]
+    pytest test_optipenn_app.py -n auto
     
 Example:
     python test_optipenn_app.py                    # Run all tests
     python test_optipenn_app.py --module login     # Run only login tests
     python test_optipenn_app.py --module dashboard # Run only dashboard tests
+    pytest test_optipenn_app.py -n auto            # Run all tests in parallel (pytest-xdist)
 """
 
 import argparse
-import base64
+import binascii
+import html
+import itertools
 import json
 import logging
+import multiprocessing
 import os
+import pickle
+import shutil
+import signal
 import subprocess
 import sys
+import tempfile
+import threading
 import time
 import traceback
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
-import urllib.parse
+from typing import Dict, List, Optional, Any
 
-try:
-    import requests
-    import psutil
-    from selenium import webdriver
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.common.keys import Keys
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    from selenium.webdriver.chrome.options import Options
-    from selenium.webdriver.common.action_chains import ActionChains
-    from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
-    from PIL import Image, ImageDraw, ImageFont
-except ImportError as e:
-    print(f"Error: Missing required dependencies. Please install:")
-    print("pip install selenium pillow requests psutil")
-    print(f"Specific error: {e}")
-    sys.exit(1)
+# Third-party modules are bound by _import_dependencies() when the first tester is created,
+# so argument parsing and --help don't pay for importing selenium
+requests = None
+webdriver = None
+By = None
+WebDriverWait = None
+EC = None
+Options = None
+TimeoutException = None
+
+def _import_dependencies():
+    """Import selenium and requests on first use and publish them as module globals"""
+    global requests, webdriver, By, WebDriverWait, EC, Options, TimeoutException
+    if webdriver is not None:
+        return
+    try:
+        import requests
+        from selenium import webdriver
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.chrome.options import Options
+        from selenium.common.exceptions import TimeoutException
+    except ImportError as e:
+        print(f"Error: Missing required dependencies. Please install:")
+        print("pip install selenium requests")
+        print(f"Specific error: {e}")
+        sys.exit(1)
+
+# Only needed for the parallel pytest entry point, which has already imported it;
+# script runs skip the import entirely
+pytest = sys.modules.get("pytest")
 
 # Configuration
 class Config:
@@ -72,9 +96,12 @@ class Config:
     DEMO_MODE = True
     SCREENSHOT_DIR = Path("test_screenshots")
     REPORT_DIR = Path("test_reports")
+    COOKIE_FILE = REPORT_DIR / "session_cookies.pkl"
+    SERVER_LOG_FILE = REPORT_DIR / "server.log"
     TIMEOUT = 10
     LONG_TIMEOUT = 30
     SERVER_STARTUP_TIMEOUT = 60
+    SERVER_READY_MARKER = "serving on port"  # Logged by server/index.ts once listening
     
     # Test credentials (demo mode)
     DEMO_EMAIL = "admin@example.com"
@@ -85,18 +112,144 @@ class Config:
     MOBILE_WIDTH = 375
     TABLET_WIDTH = 768
     DESKTOP_WIDTH = 1920
+    
+    # Assets skipped by structural tests when running with --no-images
+    BLOCKED_ASSET_PATTERNS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.woff", "*.woff2", "*.ttf"]
+    
+    # Screenshot capture
+    JPEG_QUALITY = 70  # Intermediate frames that never reach the HTML report
+    
+    # Opt-in: keep Chrome running between --module invocations (stop it with --kill-driver)
+    REUSE_DRIVER = os.environ.get("OPTIPENN_REUSE_DRIVER") == "1"
+    DRIVER_STATE_FILE = Path(tempfile.gettempdir()) / "optipenn-driver.json"
+
+# Selectors shared across test modules, defined once instead of per call site
+SELECTORS = {
+    'clients_table': "table, .table, .clients-list",
+    'edit_buttons': "[data-testid*='edit'], .edit-button, button[title*='Edit'], button[title*='Modifier']",
+    'view_buttons': "[data-testid*='view'], .view-button, button[title*='View'], button[title*='Voir']",
+    'search_box': "input[type='search'], input[placeholder*='search'], input[placeholder*='recherche']",
+    'add_button': ".add-client, .new-client, button[title*='Add'], button[title*='Ajouter']",
+    'close_button': ".close, .cancel, [aria-label*='close'], [aria-label*='fermer']",
+    'checkboxes': "input[type='checkbox']",
+    'quotes_list': "table, .table, .quotes-list",
+    'quote_actions': "button, .action, .btn",
+    'quote_filters': "select, .filter, input[type='date']",
+    'export_button': ".export, button[title*='Export'], button[title*='Exporter']",
+    'charts': "canvas, .chart, .graph, svg",
+    'kpi_elements': ".kpi, .metric, .stat-card, .card",
+    'date_inputs': "input[type='date'], .date-picker",
+    'report_export_buttons': ".export-report, button[title*='Export'], button[title*='Download']",
+    'error_elements': ".error, .not-found, h1, h2",
+    'nav': "nav, .breadcrumb, .navigation, .navbar",
+    'global_search': "[data-tour='global-search'], .global-search, input[placeholder*='Search']",
+    # Rendered by React; index.html only ships an empty #root, so this is absent until the app renders
+    'app_content': "main, [role=main], #root > *"
+}
 
+# Slotted results (no per-instance __dict__) where the running Python supports it
+@dataclass(frozen=True, **({'slots': True} if sys.version_info >= (3, 10) else {}))
 class TestResult:
     """Container for test results"""
-    def __init__(self, name: str, passed: bool = False, error: str = "", 
-                 screenshot: str = "", performance: Dict = None, ux_score: int = 0):
-        self.name = name
-        self.passed = passed
-        self.error = error
-        self.screenshot = screenshot
-        self.performance = performance or {}
-        self.ux_score = ux_score
-        self.timestamp = datetime.now()
+    __test__ = False  # Not a pytest test class
+    
+    name: str
+    passed: bool = False
+    error: str = ""
+    screenshot: str = ""
+    performance: Dict = field(default_factory=dict)
+    ux_score: int = 0
+    timestamp: datetime = field(default_factory=datetime.now)
+
+@dataclass(frozen=True)
+class TestStats:
+    """Aggregate figures for a list of test results, computed in one pass"""
+    __test__ = False  # Not a pytest test class
+    
+    total: int = 0
+    passed: int = 0
+    avg_ux: float = 0.0
+    
+    @property
+    def failed(self) -> int:
+        return self.total - self.passed
+    
+    @classmethod
+    def from_results(cls, results: List[TestResult]) -> "TestStats":
+        passed = ux_total = 0
+        for result in results:
+            passed += result.passed
+            ux_total += result.ux_score
+        total = len(results)
+        return cls(total, passed, ux_total / total if total else 0.0)
+
+# Browser-side Navigation Timing for the current document, null until the load event has finished
+_NAVIGATION_TIMING_SCRIPT = """
+const t = performance.getEntriesByType('navigation')[0];
+if (!t || t.loadEventEnd === 0) return null;
+return {
+    loadEventEnd: t.loadEventEnd,
+    responseEnd: t.responseEnd,
+    domContentLoadedEventEnd: t.domContentLoadedEventEnd
+};
+"""
+
+# Counts every selector in one querySelectorAll pass and reads the viewport and
+# body background alongside, so a full page probe costs a single WebDriver call
+_COUNT_SCRIPT = """
+const selectors = arguments[0];
+const counts = Object.fromEntries(Object.entries(selectors).map(
+    ([key, sel]) => [key, document.querySelectorAll(sel).length]));
+return {
+    counts: counts,
+    viewport: {width: window.innerWidth, height: window.innerHeight},
+    background_color: getComputedStyle(document.body).backgroundColor
+};
+"""
+
+# Counts error-page candidates and checks their rendered text in-page, avoiding a .text fetch per element
+_ERROR_PAGE_SCRIPT = """
+const elements = Array.from(document.querySelectorAll(arguments[0]));
+return {
+    count: elements.length,
+    has_error_page: elements.some(el => {
+        const text = el.innerText || '';
+        return text.includes('404') || text.toLowerCase().includes('not found');
+    })
+};
+"""
+
+# Returns the keys of selectors the browser's own CSS parser rejects
+_VALIDATE_SELECTORS_SCRIPT = """
+const invalid = [];
+for (const [key, sel] of Object.entries(arguments[0])) {
+    try { document.querySelector(sel); } catch (e) { invalid.push(key); }
+}
+return invalid;
+"""
+
+# Selector sets probed by UXAnalyzer, built once and passed to _COUNT_SCRIPT as-is
+_VISUAL_SELECTORS = {
+    'navigation': "nav, .sidebar, [role='navigation']",
+    'buttons': "button, .btn, input[type='submit']",
+    'forms': "form, .form",
+    'tables': "table, .table",
+    'cards': ".card, .panel, .widget",
+    'modals': ".modal, .dialog, [role='dialog']",
+    'responsive_elements': "[class*='responsive'], [class*='mobile'], [class*='tablet'], [class*='desktop']"
+}
+
+_A11Y_SELECTORS = {
+    'aria_elements': "[aria-label], [aria-describedby], [role]",
+    'alt_images': "img[alt]",
+    'total_images': "img",
+    'labeled_inputs': "label input, input[aria-label]",
+    'total_inputs': "input, select, textarea",
+    'headings': "h1, h2, h3, h4, h5, h6"
+}
+
+# Maximum points for image alt coverage, input label coverage and ARIA usage (totals 10)
+_A11Y_WEIGHTS = (3, 3, 4)
 
 class UXAnalyzer:
     """Analyzes UX aspects of screenshots and page elements"""
@@ -105,31 +258,17 @@ class UXAnalyzer:
     def analyze_visual_layout(driver, screenshot_path: str) -> Dict[str, Any]:
         """Analyze visual layout and design quality"""
         try:
-            # Get page dimensions and viewport
-            viewport_size = driver.execute_script("return {width: window.innerWidth, height: window.innerHeight}")
-            
-            # Check for common UI elements
-            ui_elements = {
-                'navigation': len(driver.find_elements(By.CSS_SELECTOR, "nav, .sidebar, [role='navigation']")),
-                'buttons': len(driver.find_elements(By.CSS_SELECTOR, "button, .btn, input[type='submit']")),
-                'forms': len(driver.find_elements(By.CSS_SELECTOR, "form, .form")),
-                'tables': len(driver.find_elements(By.CSS_SELECTOR, "table, .table")),
-                'cards': len(driver.find_elements(By.CSS_SELECTOR, ".card, .panel, .widget")),
-                'modals': len(driver.find_elements(By.CSS_SELECTOR, ".modal, .dialog, [role='dialog']"))
-            }
+            # Common UI elements, responsive indicators, viewport and color scheme in one round-trip
+            probe = driver.execute_script(_COUNT_SCRIPT, _VISUAL_SELECTORS)
             
-            # Check for responsive design indicators
-            responsive_elements = len(driver.find_elements(By.CSS_SELECTOR, 
-                "[class*='responsive'], [class*='mobile'], [class*='tablet'], [class*='desktop']"))
-            
-            # Check color scheme (professional/enterprise)
-            body_bg = driver.execute_script("return getComputedStyle(document.body).backgroundColor")
+            ui_elements = dict(probe['counts'])
+            responsive_elements = ui_elements.pop('responsive_elements')
             
             analysis = {
-                'viewport': viewport_size,
+                'viewport': probe['viewport'],
                 'ui_elements': ui_elements,
                 'responsive_elements': responsive_elements,
-                'background_color': body_bg,
+                'background_color': probe['background_color'],
                 'total_elements': sum(ui_elements.values()),
                 'layout_score': min(10, max(1, sum(ui_elements.values()) // 2))
             }
@@ -143,25 +282,23 @@ class UXAnalyzer:
     def check_accessibility(driver) -> Dict[str, Any]:
         """Check basic accessibility features"""
         try:
-            # Check for accessibility attributes
-            aria_elements = len(driver.find_elements(By.CSS_SELECTOR, "[aria-label], [aria-describedby], [role]"))
-            alt_images = len(driver.find_elements(By.CSS_SELECTOR, "img[alt]"))
-            total_images = len(driver.find_elements(By.CSS_SELECTOR, "img"))
-            
-            # Check form labels
-            labeled_inputs = len(driver.find_elements(By.CSS_SELECTOR, "label input, input[aria-label]"))
-            total_inputs = len(driver.find_elements(By.CSS_SELECTOR, "input, select, textarea"))
-            
-            # Check heading structure
-            headings = len(driver.find_elements(By.CSS_SELECTOR, "h1, h2, h3, h4, h5, h6"))
-            
-            accessibility_score = 0
-            if total_images > 0:
-                accessibility_score += (alt_images / total_images) * 3
-            if total_inputs > 0:
-                accessibility_score += (labeled_inputs / total_inputs) * 3
-            if aria_elements > 0:
-                accessibility_score += min(4, aria_elements / 5)
+            # Accessibility attributes, form labels and heading structure in one round-trip
+            counts = driver.execute_script(_COUNT_SCRIPT, _A11Y_SELECTORS)['counts']
+            
+            aria_elements = counts['aria_elements']
+            alt_images = counts['alt_images']
+            total_images = counts['total_images']
+            labeled_inputs = counts['labeled_inputs']
+            total_inputs = counts['total_inputs']
+            headings = counts['headings']
+            
+            # Weighted sum of coverage ratios; empty categories contribute 0 without branching
+            ratios = (
+                alt_images / max(total_images, 1),
+                labeled_inputs / max(total_inputs, 1),
+                min(4, aria_elements / 5) / 4
+            )
+            accessibility_score = sum(weight * ratio for weight, ratio in zip(_A11Y_WEIGHTS, ratios))
                 
             return {
                 'aria_elements': aria_elements,
@@ -174,15 +311,271 @@ class UXAnalyzer:
         except Exception as e:
             return {'error': str(e), 'accessibility_score': 0}
 
+# Static report <head> and stylesheet, kept out of the report f-strings so they aren't rebuilt per run
+_REPORT_HEAD_CSS = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Optipenn CRM - Automated Test Report</title>
+    <style>
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            margin: 0;
+            padding: 20px;
+            background-color: #f5f5f5;
+            color: #333;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            background: white;
+            border-radius: 8px;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+            overflow: hidden;
+        }
+        .header {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 30px;
+            text-align: center;
+        }
+        .header h1 {
+            margin: 0;
+            font-size: 2.5em;
+            font-weight: 300;
+        }
+        .header p {
+            margin: 10px 0 0 0;
+            opacity: 0.9;
+        }
+        .summary {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 20px;
+            padding: 30px;
+            background: #f8f9fa;
+        }
+        .summary-card {
+            background: white;
+            padding: 20px;
+            border-radius: 8px;
+            text-align: center;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        .summary-card h3 {
+            margin: 0 0 10px 0;
+            color: #666;
+            font-size: 0.9em;
+            text-transform: uppercase;
+            letter-spacing: 1px;
+        }
+        .summary-card .value {
+            font-size: 2em;
+            font-weight: bold;
+            margin: 0;
+        }
+        .passed { color: #28a745; }
+        .failed { color: #dc3545; }
+        .ux-score { color: #17a2b8; }
+        .duration { color: #6f42c1; }
+        .test-results {
+            padding: 30px;
+        }
+        .test-result {
+            margin-bottom: 30px;
+            border: 1px solid #e9ecef;
+            border-radius: 8px;
+            overflow: hidden;
+        }
+        .test-result.passed {
+            border-left: 4px solid #28a745;
+        }
+        .test-result.failed {
+            border-left: 4px solid #dc3545;
+        }
+        .test-header {
+            padding: 20px;
+            background: #f8f9fa;
+            border-bottom: 1px solid #e9ecef;
+        }
+        .test-header h3 {
+            margin: 0;
+            display: flex;
+            align-items: center;
+            justify-content: space-between;
+        }
+        .test-status {
+            font-size: 0.8em;
+            padding: 4px 12px;
+            border-radius: 20px;
+            color: white;
+            font-weight: bold;
+        }
+        .test-status.passed {
+            background: #28a745;
+        }
+        .test-status.failed {
+            background: #dc3545;
+        }
+        .test-content {
+            padding: 20px;
+        }
+        .test-details {
+            display: grid;
+            grid-template-columns: 1fr 1fr;
+            gap: 20px;
+            margin-bottom: 20px;
+        }
+        .test-info {
+            background: #f8f9fa;
+            padding: 15px;
+            border-radius: 6px;
+        }
+        .test-info h4 {
+            margin: 0 0 10px 0;
+            color: #666;
+            font-size: 0.9em;
+        }
+        .screenshot {
+            text-align: center;
+            margin-top: 20px;
+        }
+        .screenshot img {
+            max-width: 100%;
+            height: auto;
+            border-radius: 6px;
+            border: 1px solid #e9ecef;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+        }
+        .error-message {
+            background: #f8d7da;
+            color: #721c24;
+            padding: 15px;
+            border-radius: 6px;
+            margin-top: 15px;
+            border: 1px solid #f5c6cb;
+        }
+        .performance-metrics {
+            background: #e1f5fe;
+            padding: 15px;
+            border-radius: 6px;
+            margin-top: 15px;
+        }
+        .performance-metrics h4 {
+            margin: 0 0 10px 0;
+            color: #01579b;
+        }
+        .metric {
+            margin: 5px 0;
+        }
+        .recommendations {
+            background: #fff3cd;
+            border: 1px solid #ffeaa7;
+            padding: 20px;
+            margin: 30px;
+            border-radius: 8px;
+        }
+        .recommendations h3 {
+            margin: 0 0 15px 0;
+            color: #856404;
+        }
+        .rec-list {
+            list-style-type: none;
+            padding: 0;
+        }
+        .rec-list li {
+            padding: 8px 0;
+            border-bottom: 1px solid #ffeaa7;
+        }
+        .rec-list li:last-child {
+            border-bottom: none;
+        }
+        .footer {
+            text-align: center;
+            padding: 20px;
+            background: #f8f9fa;
+            color: #666;
+            font-size: 0.9em;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+"""
+
+_REPORT_HEADER_TMPL = """        <div class="header">
+            <h1>Optipenn CRM - Test Report</h1>
+            <p>Comprehensive Automated Testing Results</p>
+            <p>Generated on {ts}</p>
+        </div>
+        """
+
+_REPORT_FOOTER_TMPL = """
+        </div>
+        
+        {recommendations}
+        
+        <div class="footer">
+            <p>Report generated by Optipenn CRM Automated Test Suite</p>
+            <p>For technical support and UX improvements, review the detailed logs and screenshots above</p>
+        </div>
+    </div>
+</body>
+</html>
+        """
+
 class OptipennTester:
     """Main test orchestrator for Optipenn CRM"""
     
-    def __init__(self):
+    # CLI module name -> test method, in suite order
+    TEST_MODULES = {
+        'login': 'test_login_flow',
+        'dashboard': 'test_dashboard',
+        'clients': 'test_clients_management',
+        'quotes': 'test_quotes_functionality',
+        'statistics': 'test_statistics_analytics',
+        'error': 'test_error_handling',
+        'navigation': 'test_navigation_ux'
+    }
+    
+    def __init__(self, block_assets: bool = False, reuse_driver: bool = False, artifact_tag: str = ""):
+        _import_dependencies()
         self.driver = None
+        self._profile_dir = None
+        self.block_assets = block_assets
+        # Leave the browser running at cleanup and reattach to it on the next run
+        self.reuse_driver = reuse_driver
+        self._stash_profile_dir: Optional[str] = None
+        # Keep-alive session so repeated health probes reuse one socket
+        self._http = requests.Session()
+        self._http.mount("http://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=1))
+        self._http.headers['Connection'] = 'keep-alive'
         self.server_process = None
         self.test_results: List[TestResult] = []
+        # Aggregates over test_results, set by generate_html_report
+        self.stats: Optional[TestStats] = None
         self.start_time = datetime.now()
-        self.user_data_dir = None
+        # One timestamp per session plus a counter keeps artifact names unique and ordered; parallel
+        # workers start in the same second, so they add a tag to keep screenshots and logs apart
+        self._session_ts = time.strftime("%Y%m%d_%H%M%S") + (f"_{artifact_tag}" if artifact_tag else "")
+        self._ss_counter = itertools.count()
+        # Screenshot files are written in the background while the test moves on
+        self._shot_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="screenshot")
+        self._pending_shots: List[Future] = []
+        # Console errors pushed by the CDP listener, and how many have already been reported
+        self._console_errors: List[str] = []
+        self._console_errors_seen = 0
+        # Navigation Timing (seconds) of the last page loaded through measure_page_load_time
+        self.last_navigation_timing: Dict[str, float] = {}
+        self._console_listener_active = False
+        self._console_listener_ready = threading.Event()
+        # Console errors collected for the current page-load generation, which _navigate and
+        # _start_test bump, so the cache check needs no WebDriver round-trip
+        self._page_generation = 0
+        self._console_cache_generation = -1
+        self._console_cache: List[str] = []
         self.setup_directories()
         self.setup_logging()
         
@@ -193,7 +586,7 @@ class OptipennTester:
         
     def setup_logging(self):
         """Configure logging for the test session"""
-        log_file = Config.REPORT_DIR / f"test_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+        log_file = Config.REPORT_DIR / f"test_log_{self._session_ts}.log"
         logging.basicConfig(
             level=logging.INFO,
             format='%(asctime)s - %(levelname)s - %(message)s',
@@ -204,14 +597,14 @@ class OptipennTester:
         )
         self.logger = logging.getLogger(__name__)
         
-    def start_application(self) -> bool:
-        """Start the Optipenn application in demo mode"""
+    def start_application(self, spawn: bool = True) -> bool:
+        """Start the Optipenn application in demo mode (spawn=False only waits for it)"""
         try:
             self.logger.info("Starting Optipenn application in demo mode...")
             
             # Check if app is already running
             try:
-                response = requests.get(f"{Config.APP_URL}/api/health", timeout=5)
+                response = self._http.get(f"{Config.APP_URL}/api/health", timeout=5)
                 if response.status_code == 200:
                     self.logger.info("Application is already running")
                     return True
@@ -219,26 +612,40 @@ class OptipennTester:
                 pass
             
             # Start the application
-            cmd = ["npm", "run", "demo"]
-            self.server_process = subprocess.Popen(
-                cmd,
-                cwd=Path.cwd(),
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
+            ready_event = threading.Event()
+            if spawn:
+                cmd = ["npm", "run", "demo"]
+                # Own session so cleanup can signal npm together with the cross-env/tsx/node
+                # processes it starts, which would otherwise outlive it and hold the output pipe
+                self.server_process = subprocess.Popen(
+                    cmd,
+                    cwd=Path.cwd(),
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    start_new_session=True
+                )
+                threading.Thread(
+                    target=self._watch_server_output, args=(self.server_process.stdout, ready_event), daemon=True
+                ).start()
             
             # Wait for server to start
             self.logger.info("Waiting for server to start...")
-            for attempt in range(Config.SERVER_STARTUP_TIMEOUT):
+            started = time.monotonic()
+            delay = 0.1
+            while time.monotonic() - started < Config.SERVER_STARTUP_TIMEOUT:
                 try:
-                    response = requests.get(f"{Config.APP_URL}/api/health", timeout=2)
+                    response = self._http.get(f"{Config.APP_URL}/api/health", timeout=2)
                     if response.status_code == 200:
-                        self.logger.info(f"Server started successfully after {attempt + 1} seconds")
-                        time.sleep(2)  # Additional wait for full startup
+                        self.logger.info(f"Server started successfully after {time.monotonic() - started:.1f} seconds")
                         return True
                 except requests.exceptions.RequestException:
-                    time.sleep(1)
+                    pass
+                
+                # Exponential backoff, cut short once the server logs that it is listening
+                if ready_event.wait(delay):
+                    ready_event.clear()
+                delay = min(delay * 2, 1.0)
                     
             self.logger.error("Server failed to start within timeout period")
             return False
@@ -247,6 +654,32 @@ class OptipennTester:
             self.logger.error(f"Failed to start application: {e}")
             return False
     
+    def _watch_server_output(self, stream, ready_event: threading.Event):
+        """Drain server output into the server log and signal readiness on the listen line"""
+        # Draining continuously keeps a chatty server from blocking on a full pipe; the pipe
+        # is closed here at EOF, never from cleanup, which would block on this reader's lock
+        try:
+            with stream, open(Config.SERVER_LOG_FILE, 'w', encoding='utf-8', buffering=1) as log_file:
+                for line in stream:
+                    log_file.write(line)
+                    if Config.SERVER_READY_MARKER in line:
+                        ready_event.set()
+        except (OSError, ValueError):
+            pass
+    
+    def _signal_server_group(self, force: bool):
+        """Signal the server process group: npm and everything it started"""
+        if not hasattr(os, "killpg"):  # No process groups on Windows; signal npm only
+            if force:
+                self.server_process.kill()
+            else:
+                self.server_process.terminate()
+            return
+        try:
+            os.killpg(self.server_process.pid, signal.SIGKILL if force else signal.SIGTERM)
+        except ProcessLookupError:
+            pass  # The whole group has already exited
+    
     def setup_browser(self) -> bool:
         """Initialize the Chrome WebDriver with optimal settings"""
         try:
@@ -256,23 +689,40 @@ class OptipennTester:
             chrome_options.add_argument('--disable-dev-shm-usage')
             chrome_options.add_argument('--disable-gpu')
             chrome_options.add_argument('--window-size=1920,1080')
-            
-            # Create unique user data directory to avoid conflicts
-            user_data_dir = Path(__file__).parent / 'browser_data' / f'session_{int(time.time() * 1000)}'
-            user_data_dir.mkdir(parents=True, exist_ok=True)
-            chrome_options.add_argument(f'--user-data-dir={user_data_dir}')
+            # Return from get() at DOMContentLoaded; tests wait explicitly for what they need
+            chrome_options.page_load_strategy = 'eager'
+            
+            # Incognito in a throwaway profile on tmpfs (see _new_profile_dir): no first-run
+            # bootstrap, no profile data left on disk, and teardown never walks a disk directory tree
+            chrome_options.add_argument('--incognito')
+            chrome_options.add_argument('--no-first-run')
+            chrome_options.add_argument('--disable-extensions')
+            chrome_options.add_argument('--disable-default-apps')
+            chrome_options.add_argument('--disable-sync')
+            chrome_options.add_argument('--disable-background-networking')
+            chrome_options.add_argument('--disable-renderer-backgrounding')
+            chrome_options.add_argument('--disable-features=TranslateUI,OptimizationHints,AutofillServerCommunication')
             
             # Enterprise-focused settings
             chrome_options.add_argument('--disable-web-security')
             chrome_options.add_argument('--allow-running-insecure-content')
             chrome_options.add_experimental_option('useAutomationExtension', False)
             chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            
-            # Store user data dir for cleanup
-            self.user_data_dir = user_data_dir
-            
-            self.driver = webdriver.Chrome(options=chrome_options)
-            self.driver.implicitly_wait(Config.TIMEOUT)
+            chrome_options.add_experimental_option("prefs", {
+                "autofill.profile_enabled": False,
+                "autofill.credit_card_enabled": False
+            })
+            
+            if self.reuse_driver:
+                self.driver = self._attach_stashed_driver(chrome_options)
+            if self.driver is None:
+                chrome_options.add_argument(f'--user-data-dir={self._new_profile_dir()}')
+                self.driver = webdriver.Chrome(options=chrome_options)
+            # Explicit waits only: an implicit wait would stall every empty find_elements
+            # probe for the full timeout and compound inside WebDriverWait polling
+            self.driver.implicitly_wait(0)
+            self.start_console_listener()
+            self._validate_selectors()
             
             self.logger.info("Browser initialized successfully")
             return True
@@ -281,14 +731,133 @@ class OptipennTester:
             self.logger.error(f"Failed to setup browser: {e}")
             return False
     
-    def take_screenshot(self, name: str, description: str = "") -> str:
-        """Take a screenshot and return the file path"""
+    def _new_profile_dir(self) -> str:
+        """Create the Chrome profile directory, on tmpfs when available"""
+        parent = "/dev/shm" if os.path.isdir("/dev/shm") else None
+        if self.reuse_driver:
+            # Outlives this process along with the stashed browser; --kill-driver removes it
+            self._stash_profile_dir = tempfile.mkdtemp(dir=parent, prefix="optipenn-chrome-")
+            return self._stash_profile_dir
+        self._profile_dir = tempfile.TemporaryDirectory(dir=parent, prefix="optipenn-chrome-")
+        return self._profile_dir.name
+    
+    def _attach_stashed_driver(self, chrome_options) -> Optional[Any]:
+        """Reconnect to the browser session left running by a previous run, if it is still alive"""
+        state = self._read_stash_state()
+        if state is None:
+            return None
+        try:
+            alive = self._http.get(f"{state['url']}/status", timeout=2).ok
+        except (KeyError, requests.RequestException):
+            alive = False
+        if not alive:
+            self.logger.info("Stashed chromedriver is gone, starting a new browser")
+            self._teardown_stashed_driver(state)
+            return None
+        
+        from selenium.common.exceptions import WebDriverException
+        from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+        
+        class StashedChrome(webdriver.Remote):
+            def start_session(self, capabilities):
+                # Adopt the running session instead of launching a new browser
+                self.session_id = state['session_id']
+                self.caps = state['caps']
+            
+            def execute_cdp_cmd(self, cmd, cmd_args):
+                return self.execute("executeCdpCommand", {"cmd": cmd, "params": cmd_args})["value"]
+        
+        try:
+            driver = StashedChrome(
+                command_executor=ChromiumRemoteConnection(state['url'], "goog", "chrome"),
+                options=chrome_options
+            )
+            driver.current_url  # Fails if the browser behind the session has gone away
+            # Start from the same clean state as a fresh incognito browser
+            driver.delete_all_cookies()
+        except WebDriverException as e:
+            self.logger.info(f"Stashed browser session unusable, starting a new one: {e}")
+            # Otherwise the old chromedriver and profile outlive the state file we are about to replace
+            self._teardown_stashed_driver(state)
+            return None
+        
+        self._stash_profile_dir = state.get('profile_dir')
+        self.logger.info("Reusing stashed browser session")
+        return driver
+    
+    def _stash_driver(self, driver):
+        """Leave the browser running and record how to reattach to it"""
+        service = getattr(driver, 'service', None)
+        if service is None:
+            return  # Already a reattached session; its state file is still current
+        Config.DRIVER_STATE_FILE.write_text(json.dumps({
+            'url': service.service_url,
+            'session_id': driver.session_id,
+            'caps': driver.caps,
+            'profile_dir': self._stash_profile_dir
+        }))
+        # Detach chromedriver from its Service so exiting this process doesn't stop it
+        service.process = None
+        self.logger.info("Browser left running for reuse")
+    
+    def kill_stashed_driver(self) -> bool:
+        """Quit the browser kept alive by OPTIPENN_REUSE_DRIVER and forget it"""
+        state = self._read_stash_state()
+        if state is None:
+            return False
+        self._teardown_stashed_driver(state)
+        self.logger.info("Stashed browser closed")
+        return True
+    
+    def _read_stash_state(self) -> Optional[Dict[str, Any]]:
+        """Load the stashed browser state, or None when there is none (a corrupt file is removed)"""
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{timestamp}_{name}.png"
+            return json.loads(Config.DRIVER_STATE_FILE.read_text())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            Config.DRIVER_STATE_FILE.unlink(missing_ok=True)
+            return None
+    
+    def _teardown_stashed_driver(self, state: Dict[str, Any]):
+        """End a stashed session, shut its chromedriver down and remove its profile and state file"""
+        Config.DRIVER_STATE_FILE.unlink(missing_ok=True)
+        url = state.get('url')
+        if url:
+            try:
+                if state.get('session_id'):
+                    self._http.delete(f"{url}/session/{state['session_id']}", timeout=5)
+                self._http.get(f"{url}/shutdown", timeout=5)
+            except requests.RequestException as e:
+                self.logger.warning(f"Could not shut down stashed browser: {e}")
+        if state.get('profile_dir'):
+            shutil.rmtree(state['profile_dir'], ignore_errors=True)
+    
+    def _validate_selectors(self):
+        """Fail fast on selector typos by parsing every shared selector once in the browser"""
+        invalid = self.driver.execute_script(
+            _VALIDATE_SELECTORS_SCRIPT, {**SELECTORS, **_VISUAL_SELECTORS, **_A11Y_SELECTORS}
+        )
+        if invalid:
+            raise ValueError(f"Invalid CSS selectors: {', '.join(invalid)}")
+    
+    def take_screenshot(self, name: str, description: str = "", intermediate: bool = False) -> str:
+        """Take a screenshot and return the file path (intermediate frames are saved as JPEG)"""
+        try:
+            prefix = f"{self._session_ts}_{next(self._ss_counter):03d}"
+            if intermediate:
+                filename = f"{prefix}_{name}.jpg"
+                params = {"format": "jpeg", "quality": Config.JPEG_QUALITY, "fromSurface": False}
+            else:
+                filename = f"{prefix}_{name}.png"
+                params = {"format": "png", "fromSurface": False}
             filepath = Config.SCREENSHOT_DIR / filename
             
-            self.driver.save_screenshot(str(filepath))
+            # Capture through CDP directly instead of save_screenshot's extra encode/round-trip.
+            # a2b_base64 decodes the ASCII str in place, skipping b64decode's bytes copy.
+            # The decode and write overlap with the next WebDriver call.
+            data = self.driver.execute_cdp_cmd("Page.captureScreenshot", params)['data']
+            self._pending_shots.append(self._shot_pool.submit(self._write_screenshot, filepath, data))
             
             # Log visual analysis
             visual_analysis = UXAnalyzer.analyze_visual_layout(self.driver, str(filepath))
@@ -306,48 +875,254 @@ class OptipennTester:
             self.logger.error(f"Failed to take screenshot: {e}")
             return ""
     
-    def wait_for_element(self, by: By, selector: str, timeout: int = None) -> Optional[Any]:
+    def _write_screenshot(self, filepath: Path, data: str):
+        """Decode and write a captured screenshot (runs on the screenshot pool)"""
+        try:
+            filepath.write_bytes(binascii.a2b_base64(data))
+        except Exception as e:
+            self.logger.error(f"Failed to write screenshot {filepath.name}: {e}")
+    
+    def flush_screenshots(self):
+        """Block until every submitted screenshot has been written"""
+        pending, self._pending_shots = self._pending_shots, []
+        wait(pending)
+    
+    def wait_for_element(self, by: str, selector: str, timeout: int = None) -> Optional[Any]:
         """Wait for an element to be present and return it"""
         try:
-            wait = WebDriverWait(self.driver, timeout or Config.TIMEOUT)
-            return wait.until(EC.presence_of_element_located((by, selector)))
+            wait = WebDriverWait(self.driver, timeout or Config.TIMEOUT)
+            return wait.until(EC.presence_of_element_located((by, selector)))
+        except TimeoutException:
+            return None
+    
+    def wait_for_clickable(self, by: str, selector: str, timeout: int = None) -> Optional[Any]:
+        """Wait for an element to be clickable and return it"""
+        try:
+            wait = WebDriverWait(self.driver, timeout or Config.TIMEOUT)
+            return wait.until(EC.element_to_be_clickable((by, selector)))
+        except TimeoutException:
+            return None
+    
+    def save_session_cookies(self):
+        """Persist the authenticated session cookies so other workers can skip login"""
+        try:
+            tmp_file = Config.COOKIE_FILE.with_name(f"{Config.COOKIE_FILE.name}.{os.getpid()}")
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(self.driver.get_cookies(), f)
+            os.replace(tmp_file, Config.COOKIE_FILE)
+        except Exception as e:
+            self.logger.warning(f"Could not persist session cookies: {e}")
+    
+    def load_session_cookies(self) -> bool:
+        """Restore persisted session cookies and return whether the session is authenticated"""
+        if not Config.COOKIE_FILE.exists():
+            return False
+        try:
+            with open(Config.COOKIE_FILE, 'rb') as f:
+                cookies = pickle.load(f)
+            
+            # Cookies can only be added for the domain currently loaded
+            self._navigate(f"{Config.APP_URL}/login")
+            for cookie in cookies:
+                self.driver.add_cookie(cookie)
+            
+            # Same probe the client's ProtectedRoute uses to decide on a login redirect
+            status = self.driver.execute_script(
+                "return fetch('/api/statistics', {credentials: 'include'}).then(r => r.status)"
+            )
+            return status != 401
+        except Exception as e:
+            self.logger.warning(f"Could not restore session cookies: {e}")
+            return False
+    
+    def set_asset_blocking(self, enabled: bool):
+        """Block (or unblock) image and font downloads for checks that don't need rendering"""
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd("Network.setBlockedURLs", {
+            "urls": Config.BLOCKED_ASSET_PATTERNS if enabled else []
+        })
+    
+    def _unblocked_screenshot(self, name: str, description: str) -> str:
+        """Lift asset blocking, reload, and capture the fully styled page for the report"""
+        self.set_asset_blocking(False)
+        self._navigate(self.driver.current_url)
+        self._wait_ready(SELECTORS['app_content'])
+        screenshot = self.take_screenshot(name, description)
+        # The test already read this page's console errors; don't count the reload's again
+        self._collect_console_errors()
+        return screenshot
+    
+    def _load_time_key(self) -> str:
+        """Performance key for a page load timed with asset blocking, kept out of the slow-page check"""
+        return 'load_time_assets_blocked' if self.block_assets else 'load_time'
+    
+    def _wait_ready(self, extra_selector: str = None) -> bool:
+        """Wait for document readiness and, optionally, for a selector; False if it never appears"""
+        wait = WebDriverWait(self.driver, Config.TIMEOUT)
+        try:
+            wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
+            if extra_selector:
+                wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, extra_selector)))
+            return True
+        except TimeoutException:
+            return False
+    
+    def count_elements(self, selectors: Dict[str, str]) -> Dict[str, int]:
+        """Count elements for several named selectors in a single round-trip"""
+        return self.driver.execute_script(_COUNT_SCRIPT, selectors)['counts']
+    
+    def wait_for_counts(self, selectors: Dict[str, str], timeout: int = None) -> Dict[str, int]:
+        """Poll element counts for several selectors until all are present, returning the last counts"""
+        counts = {key: 0 for key in selectors}
+        
+        def all_present(driver):
+            nonlocal counts
+            counts = self.count_elements(selectors)
+            return all(counts.values())
+        
+        try:
+            WebDriverWait(self.driver, timeout or Config.TIMEOUT).until(all_present)
         except TimeoutException:
-            return None
+            pass
+        return counts
     
-    def wait_for_clickable(self, by: By, selector: str, timeout: int = None) -> Optional[Any]:
-        """Wait for an element to be clickable and return it"""
+    def js_count(self, selector: str) -> int:
+        """Count elements matching a CSS selector in-page, without serializing element handles"""
+        return self.driver.execute_script("return document.querySelectorAll(arguments[0]).length", selector)
+    
+    def ensure_logged_in(self) -> bool:
+        """Restore the persisted session, or run the login flow when it is missing or expired"""
+        if self.load_session_cookies():
+            return True
+        return self.test_login_flow().passed
+    
+    def find_first(self, selector: str) -> Optional[Any]:
+        """Return the first element matching a CSS selector, or None, in a single lookup"""
+        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+        return elements[0] if elements else None
+    
+    def emulate_viewport(self, width: int, height: int, mobile: bool = True):
+        """Emulate a device viewport via CDP and wait until the page reports the new width"""
+        self.driver.execute_cdp_cmd("Emulation.setDeviceMetricsOverride", {
+            "width": width,
+            "height": height,
+            "deviceScaleFactor": 1,
+            "mobile": mobile
+        })
         try:
-            wait = WebDriverWait(self.driver, timeout or Config.TIMEOUT)
-            return wait.until(EC.element_to_be_clickable((by, selector)))
+            WebDriverWait(self.driver, 2).until(
+                lambda driver: driver.execute_script("return window.innerWidth") == width
+            )
         except TimeoutException:
-            return None
+            self.logger.warning(f"Viewport did not settle at {width}px width")
     
-    def measure_page_load_time(self, url: str) -> float:
-        """Measure page load time"""
-        start_time = time.time()
+    def _start_test(self, test_name: str):
+        """Log the start of a test and drop console errors cached by the previous one"""
+        # A test can begin on the page the previous test left open (e.g. the dashboard after
+        # login), so a new test starts a new console-error generation even without navigating
+        self._page_generation += 1
+        self.logger.info(f"Starting {test_name}")
+    
+    def _navigate(self, url: str):
+        """Load a URL, invalidating state cached for the previous page load"""
+        self._page_generation += 1
         self.driver.get(url)
+    
+    def measure_page_load_time(self, url: str) -> float:
+        """Measure page load time from the browser's Navigation Timing entry"""
+        self._navigate(url)
         
-        # Wait for page to be fully loaded
-        WebDriverWait(self.driver, Config.LONG_TIMEOUT).until(
-            lambda driver: driver.execute_script("return document.readyState") == "complete"
+        # With the eager strategy get() returns at DOMContentLoaded, so this polls through the
+        # gap until the load event has finished and loadEventEnd is set
+        timings = WebDriverWait(self.driver, Config.LONG_TIMEOUT, poll_frequency=0.05).until(
+            lambda driver: driver.execute_script(_NAVIGATION_TIMING_SCRIPT)
         )
         
-        end_time = time.time()
-        return end_time - start_time
+        self.last_navigation_timing = {
+            'response_end': timings['responseEnd'] / 1000.0,
+            'dom_content_loaded': timings['domContentLoadedEventEnd'] / 1000.0,
+            'load_event_end': timings['loadEventEnd'] / 1000.0
+        }
+        self.logger.info(
+            f"Navigation timing for {url}: response {self.last_navigation_timing['response_end']:.2f}s, "
+            f"DOMContentLoaded {self.last_navigation_timing['dom_content_loaded']:.2f}s, "
+            f"load {self.last_navigation_timing['load_event_end']:.2f}s"
+        )
+        return self.last_navigation_timing['load_event_end']
     
-    def check_console_errors(self) -> List[str]:
-        """Check for JavaScript console errors"""
+    def start_console_listener(self):
+        """Subscribe once to CDP console, exception and log events on a background thread"""
+        threading.Thread(target=self._run_console_listener, daemon=True).start()
+        self._console_listener_ready.wait(timeout=5)
+        if not self._console_listener_active:
+            self.logger.warning("CDP console listener unavailable, falling back to browser log polling")
+    
+    def _run_console_listener(self):
+        """Collect console errors pushed over the DevTools connection until the browser closes"""
+        async def consume(session, event_type, to_message):
+            async for event in session.listen(event_type):
+                message = to_message(event)
+                if message:
+                    self._console_errors.append(message)
+        
+        async def listen():
+            async with self.driver.bidi_connection() as connection:
+                session, devtools = connection.session, connection.devtools
+                await session.execute(devtools.runtime.enable())
+                await session.execute(devtools.log.enable())
+                async with trio.open_nursery() as nursery:
+                    nursery.start_soon(consume, session, devtools.runtime.ConsoleAPICalled,
+                        lambda e: " ".join(str(arg.value if arg.value is not None else arg.description)
+                                           for arg in e.args) if e.type_ == "error" else None)
+                    nursery.start_soon(consume, session, devtools.runtime.ExceptionThrown,
+                        lambda e: e.exception_details.exception.description
+                        if e.exception_details.exception else e.exception_details.text)
+                    nursery.start_soon(consume, session, devtools.log.EntryAdded,
+                        lambda e: e.entry.text if e.entry.level == "error" else None)
+                    self._console_listener_active = True
+                    self._console_listener_ready.set()
+        
         try:
-            logs = self.driver.get_log('browser')
-            errors = [log['message'] for log in logs if log['level'] == 'SEVERE']
-            return errors
+            import trio  # Installed with selenium, which runs its CDP client on trio
+            trio.run(listen)
         except Exception:
-            return []
+            pass  # Connection closes when the browser quits
+        finally:
+            self._console_listener_ready.set()
+    
+    def _wait_for_console_event(self, timeout: float = 2):
+        """Give pushed console events a short window to arrive (browser log polling needs none)"""
+        if not self._console_listener_active:
+            return
+        deadline = time.monotonic() + timeout
+        while len(self._console_errors) <= self._console_errors_seen and time.monotonic() < deadline:
+            time.sleep(0.05)
+    
+    def check_console_errors(self) -> List[str]:
+        """Return JavaScript console errors for the current page load, collected once per load"""
+        if self._console_cache_generation != self._page_generation:
+            self._console_cache = self._collect_console_errors()
+            self._console_cache_generation = self._page_generation
+        return self._console_cache
+    
+    def _collect_console_errors(self) -> List[str]:
+        """Return JavaScript console errors recorded since the previous collection"""
+        if not self._console_listener_active:
+            try:
+                logs = self.driver.get_log('browser')
+                errors = [log['message'] for log in logs if log['level'] == 'SEVERE']
+            except Exception:
+                return []
+        else:
+            errors = self._console_errors[self._console_errors_seen:]
+            self._console_errors_seen += len(errors)
+        # Requests refused by --no-images asset blocking are not application errors
+        return [error for error in errors if "ERR_BLOCKED_BY_CLIENT" not in error]
     
     def test_login_flow(self) -> TestResult:
         """Test the complete login flow"""
         test_name = "Login Flow"
-        self.logger.info(f"Starting {test_name}")
+        self._start_test(test_name)
         
         try:
             # Navigate to login page
@@ -383,6 +1158,7 @@ class OptipennTester:
             )
             
             screenshot = self.take_screenshot("03_login_success", "Successful login - redirected to dashboard")
+            self.save_session_cookies()
             
             # Check for console errors
             console_errors = self.check_console_errors()
@@ -414,7 +1190,7 @@ class OptipennTester:
     def test_dashboard(self) -> TestResult:
         """Test dashboard functionality and UI"""
         test_name = "Dashboard"
-        self.logger.info(f"Starting {test_name}")
+        self._start_test(test_name)
         
         try:
             # Navigate to dashboard if not already there
@@ -425,43 +1201,39 @@ class OptipennTester:
             
             screenshot = self.take_screenshot("04_dashboard_main", "Main dashboard view")
             
-            # Check for key dashboard elements
-            dashboard_elements = {
-                'title': self.wait_for_element(By.CSS_SELECTOR, "h1, h2, .dashboard-title"),
-                'stats_cards': self.driver.find_elements(By.CSS_SELECTOR, ".card, .widget, .stat-card"),
-                'navigation': self.wait_for_element(By.CSS_SELECTOR, "nav, .sidebar, .navigation"),
-                'content_area': self.wait_for_element(By.CSS_SELECTOR, "main, .main-content, .dashboard-content")
-            }
-            
-            missing_elements = [key for key, element in dashboard_elements.items() if not element]
+            # Check for key dashboard elements, all in one round-trip per poll
+            dashboard_elements = self.wait_for_counts({
+                'title': "h1, h2, .dashboard-title",
+                'stats_cards': ".card, .widget, .stat-card",
+                'navigation': "nav, .sidebar, .navigation",
+                'content_area': "main, .main-content, .dashboard-content"
+            })
             
-            # Test responsive design
-            original_size = self.driver.get_window_size()
+            missing_elements = [key for key, count in dashboard_elements.items() if count == 0]
             
+            # Test responsive design through device emulation rather than resizing the window.
+            # Viewports are captured in sequence on purpose: chromedriver runs one command at a
+            # time per session, and extra tabs would each pay a full page load for no overlap.
             # Mobile view
-            self.driver.set_window_size(Config.MOBILE_WIDTH, 800)
-            time.sleep(1)
-            mobile_screenshot = self.take_screenshot("05_dashboard_mobile", "Dashboard in mobile view")
+            self.emulate_viewport(Config.MOBILE_WIDTH, 800)
+            mobile_screenshot = self.take_screenshot("05_dashboard_mobile", "Dashboard in mobile view", intermediate=True)
             
             # Tablet view
-            self.driver.set_window_size(Config.TABLET_WIDTH, 1024)
-            time.sleep(1)
-            tablet_screenshot = self.take_screenshot("06_dashboard_tablet", "Dashboard in tablet view")
+            self.emulate_viewport(Config.TABLET_WIDTH, 1024)
+            tablet_screenshot = self.take_screenshot("06_dashboard_tablet", "Dashboard in tablet view", intermediate=True)
             
             # Restore original size
-            self.driver.set_window_size(original_size['width'], original_size['height'])
-            time.sleep(1)
+            self.driver.execute_cdp_cmd("Emulation.clearDeviceMetricsOverride", {})
             
             # Check for data loading
-            data_elements = self.driver.find_elements(By.CSS_SELECTOR, 
-                ".chart, .graph, .table, .data-table, .statistics")
+            data_elements_count = self.js_count(".chart, .graph, .table, .data-table, .statistics")
             
             # Performance analysis
             console_errors = self.check_console_errors()
             performance = {
                 'load_time': round(load_time, 2),
-                'stats_cards_count': len(dashboard_elements.get('stats_cards', [])),
-                'data_elements_count': len(data_elements),
+                'stats_cards_count': dashboard_elements['stats_cards'],
+                'data_elements_count': data_elements_count,
                 'console_errors': len(console_errors),
                 'missing_elements': missing_elements
             }
@@ -470,7 +1242,7 @@ class OptipennTester:
             ux_score = 8
             if missing_elements:
                 ux_score -= len(missing_elements)
-            if len(data_elements) == 0:
+            if data_elements_count == 0:
                 ux_score -= 2
             if console_errors:
                 ux_score -= len(console_errors)
@@ -491,66 +1263,71 @@ class OptipennTester:
     def test_clients_management(self) -> TestResult:
         """Test clients page and management features"""
         test_name = "Clients Management"
-        self.logger.info(f"Starting {test_name}")
+        self._start_test(test_name)
         
         try:
+            # Structural checks only: skip image and font bytes when asked to
+            if self.block_assets:
+                self.set_asset_blocking(True)
+            
             # Navigate to clients page
             load_time = self.measure_page_load_time(f"{Config.APP_URL}/clients")
-            screenshot = self.take_screenshot("07_clients_main", "Clients page main view")
+            # With assets blocked, the report screenshot waits for an unblocked reload after the probes
+            screenshot = None if self.block_assets else self.take_screenshot("07_clients_main", "Clients page main view")
             
             # Check for clients table/list
-            clients_table = self.wait_for_element(By.CSS_SELECTOR, "table, .table, .clients-list")
+            clients_table = self.wait_for_element(By.CSS_SELECTOR, SELECTORS['clients_table'])
             if not clients_table:
+                if screenshot is None:
+                    screenshot = self._unblocked_screenshot("07_clients_main", "Clients page main view")
                 return TestResult(test_name, False, "Clients table not found", screenshot)
             
             # Look for action buttons (Edit, View, Delete)
-            edit_buttons = self.driver.find_elements(By.CSS_SELECTOR, 
-                "[data-testid*='edit'], .edit-button, button[title*='Edit'], button[title*='Modifier']")
-            view_buttons = self.driver.find_elements(By.CSS_SELECTOR, 
-                "[data-testid*='view'], .view-button, button[title*='View'], button[title*='Voir']")
+            counts = self.count_elements({
+                'edit': SELECTORS['edit_buttons'],
+                'view': SELECTORS['view_buttons']
+            })
+            edit_buttons_count = counts['edit']
+            view_buttons_count = counts['view']
             
             # Test search functionality if available
-            search_box = self.driver.find_element(By.CSS_SELECTOR, 
-                "input[type='search'], input[placeholder*='search'], input[placeholder*='recherche']") if self.driver.find_elements(By.CSS_SELECTOR, 
-                "input[type='search'], input[placeholder*='search'], input[placeholder*='recherche']") else None
+            search_box = self.find_first(SELECTORS['search_box'])
             
             if search_box:
                 search_box.send_keys("test")
                 time.sleep(1)
-                search_screenshot = self.take_screenshot("08_clients_search", "Clients search functionality")
+                search_screenshot = self.take_screenshot("08_clients_search", "Clients search functionality", intermediate=True)
                 search_box.clear()
             
             # Test creating new client (look for Add/Create button)
-            add_button = self.driver.find_element(By.CSS_SELECTOR, 
-                ".add-client, .new-client, button[title*='Add'], button[title*='Ajouter']") if self.driver.find_elements(By.CSS_SELECTOR, 
-                ".add-client, .new-client, button[title*='Add'], button[title*='Ajouter']") else None
+            add_button = self.find_first(SELECTORS['add_button'])
             
             if add_button:
                 add_button.click()
                 time.sleep(2)
-                modal_screenshot = self.take_screenshot("09_clients_add_modal", "Add client modal/form")
+                modal_screenshot = self.take_screenshot("09_clients_add_modal", "Add client modal/form", intermediate=True)
                 
                 # Close modal if opened
-                close_button = self.driver.find_element(By.CSS_SELECTOR, 
-                    ".close, .cancel, [aria-label*='close'], [aria-label*='fermer']") if self.driver.find_elements(By.CSS_SELECTOR, 
-                    ".close, .cancel, [aria-label*='close'], [aria-label*='fermer']") else None
+                close_button = self.find_first(SELECTORS['close_button'])
                 if close_button:
                     close_button.click()
                     time.sleep(1)
             
             # Test bulk operations if available
-            checkboxes = self.driver.find_elements(By.CSS_SELECTOR, "input[type='checkbox']")
+            checkboxes = self.driver.find_elements(By.CSS_SELECTOR, SELECTORS['checkboxes'])
             if len(checkboxes) > 1:  # At least one client checkbox plus potential select-all
                 checkboxes[1].click()  # Select first client
                 time.sleep(1)
-                bulk_screenshot = self.take_screenshot("10_clients_bulk_select", "Bulk operations selection")
+                bulk_screenshot = self.take_screenshot("10_clients_bulk_select", "Bulk operations selection", intermediate=True)
             
             # Performance analysis
             console_errors = self.check_console_errors()
+            if screenshot is None:
+                screenshot = self._unblocked_screenshot("07_clients_main", "Clients page main view")
             performance = {
-                'load_time': round(load_time, 2),
-                'edit_buttons_count': len(edit_buttons),
-                'view_buttons_count': len(view_buttons),
+                self._load_time_key(): round(load_time, 2),
+                'edit_buttons_count': edit_buttons_count,
+                'view_buttons_count': view_buttons_count,
                 'has_search': search_box is not None,
                 'has_add_button': add_button is not None,
                 'console_errors': len(console_errors)
@@ -558,7 +1335,7 @@ class OptipennTester:
             
             # UX Score
             ux_score = 7
-            if len(edit_buttons) == 0:
+            if edit_buttons_count == 0:
                 ux_score -= 2
             if not search_box:
                 ux_score -= 1
@@ -576,58 +1353,69 @@ class OptipennTester:
             error_screenshot = self.take_screenshot("error_clients", f"Clients test failed: {str(e)}")
             self.logger.error(f"Clients test failed: {e}")
             return TestResult(test_name, False, str(e), error_screenshot)
+        
+        finally:
+            if self.block_assets:
+                self.set_asset_blocking(False)
     
     def test_quotes_functionality(self) -> TestResult:
         """Test quotes/devis page and functionality"""
         test_name = "Quotes Functionality"
-        self.logger.info(f"Starting {test_name}")
+        self._start_test(test_name)
         
         try:
+            # Structural checks only: skip image and font bytes when asked to
+            if self.block_assets:
+                self.set_asset_blocking(True)
+            
             # Navigate to quotes page
             load_time = self.measure_page_load_time(f"{Config.APP_URL}/quotes")
-            screenshot = self.take_screenshot("11_quotes_main", "Quotes page main view")
+            # With assets blocked, the report screenshot waits for an unblocked reload after the probes
+            screenshot = None if self.block_assets else self.take_screenshot("11_quotes_main", "Quotes page main view")
             
             # Check for quotes table/list
-            quotes_element = self.wait_for_element(By.CSS_SELECTOR, "table, .table, .quotes-list")
+            quotes_element = self.wait_for_element(By.CSS_SELECTOR, SELECTORS['quotes_list'])
             if not quotes_element:
+                if screenshot is None:
+                    screenshot = self._unblocked_screenshot("11_quotes_main", "Quotes page main view")
                 return TestResult(test_name, False, "Quotes table/list not found", screenshot)
             
-            # Look for quote-specific actions
-            quote_actions = self.driver.find_elements(By.CSS_SELECTOR, 
-                "button, .action, .btn") 
-            
-            # Test filters if available
-            filter_elements = self.driver.find_elements(By.CSS_SELECTOR, 
-                "select, .filter, input[type='date']")
+            # Quote-specific actions and filters in one round-trip
+            counts = self.count_elements({
+                'actions': SELECTORS['quote_actions'],
+                'filters': SELECTORS['quote_filters']
+            })
+            quote_actions_count = counts['actions']
+            filter_elements_count = counts['filters']
             
-            if filter_elements:
-                filter_screenshot = self.take_screenshot("12_quotes_filters", "Quotes filtering options")
+            if filter_elements_count:
+                filter_screenshot = self.take_screenshot("12_quotes_filters", "Quotes filtering options", intermediate=True)
             
             # Test export functionality if available
-            export_button = self.driver.find_element(By.CSS_SELECTOR, 
-                ".export, button[title*='Export'], button[title*='Exporter']") if self.driver.find_elements(By.CSS_SELECTOR, 
-                ".export, button[title*='Export'], button[title*='Exporter']") else None
+            export_button = self.find_first(SELECTORS['export_button'])
             
             if export_button:
                 export_button.click()
                 time.sleep(2)
-                export_screenshot = self.take_screenshot("13_quotes_export", "Export functionality")
+                export_screenshot = self.take_screenshot("13_quotes_export", "Export functionality", intermediate=True)
             
             # Performance analysis
             console_errors = self.check_console_errors()
+            if screenshot is None:
+                screenshot = self._unblocked_screenshot("11_quotes_main", "Quotes page main view")
             performance = {
-                'load_time': round(load_time, 2),
-                'quote_actions_count': len(quote_actions),
-                'filter_elements_count': len(filter_elements),
+                self._load_time_key(): round(load_time, 2),
+                'quote_actions_count': quote_actions_count,
+                'filter_elements_count': filter_elements_count,
                 'has_export': export_button is not None,
                 'console_errors': len(console_errors)
             }
             
             # UX Score
             ux_score = 8
-            if len(quote_actions) == 0:
+            if quote_actions_count == 0:
                 ux_score -= 2
-            if len(filter_elements) == 0:
+            if filter_elements_count == 0:
                 ux_score -= 1
             if console_errors:
                 ux_score -= len(console_errors)
@@ -641,60 +1429,66 @@ class OptipennTester:
             error_screenshot = self.take_screenshot("error_quotes", f"Quotes test failed: {str(e)}")
             self.logger.error(f"Quotes test failed: {e}")
             return TestResult(test_name, False, str(e), error_screenshot)
+        
+        finally:
+            if self.block_assets:
+                self.set_asset_blocking(False)
     
     def test_statistics_analytics(self) -> TestResult:
         """Test statistics/analytics page"""
         test_name = "Statistics & Analytics"
-        self.logger.info(f"Starting {test_name}")
+        self._start_test(test_name)
         
         try:
             # Navigate to statistics page
             load_time = self.measure_page_load_time(f"{Config.APP_URL}/statistics")
             screenshot = self.take_screenshot("14_statistics_main", "Statistics page main view")
             
-            # Check for charts and analytics
-            charts = self.driver.find_elements(By.CSS_SELECTOR, 
-                "canvas, .chart, .graph, svg")
-            
-            # Check for KPI cards/metrics
-            kpi_elements = self.driver.find_elements(By.CSS_SELECTOR, 
-                ".kpi, .metric, .stat-card, .card")
+            # Wait for the page to render before probing, since lookups no longer wait implicitly
+            self.wait_for_element(By.CSS_SELECTOR, f"{SELECTORS['charts']}, {SELECTORS['kpi_elements']}")
             
-            # Test date range picker if available
-            date_inputs = self.driver.find_elements(By.CSS_SELECTOR, 
-                "input[type='date'], .date-picker")
-            
-            if date_inputs:
-                date_screenshot = self.take_screenshot("15_statistics_date_filter", "Date filtering for statistics")
+            # Check for charts and analytics
+            # Charts, KPI cards/metrics, date range pickers and report exports in one round-trip
+            counts = self.count_elements({
+                'charts': SELECTORS['charts'],
+                'kpi_elements': SELECTORS['kpi_elements'],
+                'date_inputs': SELECTORS['date_inputs'],
+                'export_buttons': SELECTORS['report_export_buttons']
+            })
+            charts_count = counts['charts']
+            kpi_elements_count = counts['kpi_elements']
+            date_inputs_count = counts['date_inputs']
+            
+            if date_inputs_count:
+                date_screenshot = self.take_screenshot("15_statistics_date_filter", "Date filtering for statistics", intermediate=True)
             
             # Test export of reports if available
-            export_buttons = self.driver.find_elements(By.CSS_SELECTOR, 
-                ".export-report, button[title*='Export'], button[title*='Download']")
+            export_buttons_count = counts['export_buttons']
             
             # Performance analysis
             console_errors = self.check_console_errors()
             performance = {
                 'load_time': round(load_time, 2),
-                'charts_count': len(charts),
-                'kpi_elements_count': len(kpi_elements),
-                'date_filters_count': len(date_inputs),
-                'export_buttons_count': len(export_buttons),
+                'charts_count': charts_count,
+                'kpi_elements_count': kpi_elements_count,
+                'date_filters_count': date_inputs_count,
+                'export_buttons_count': export_buttons_count,
                 'console_errors': len(console_errors)
             }
             
             # UX Score
             ux_score = 6
-            if len(charts) > 0:
+            if charts_count > 0:
                 ux_score += 2
-            if len(kpi_elements) > 0:
+            if kpi_elements_count > 0:
                 ux_score += 1
-            if len(date_inputs) > 0:
+            if date_inputs_count > 0:
                 ux_score += 1
             if console_errors:
                 ux_score -= len(console_errors)
             ux_score = max(1, min(10, ux_score))
             
-            success = len(charts) > 0 or len(kpi_elements) > 0
+            success = charts_count > 0 or kpi_elements_count > 0
             error_msg = "No charts or KPI elements found" if not success else ""
             
             self.logger.info(f"Statistics test completed. UX Score: {ux_score}/10")
@@ -709,27 +1503,26 @@ class OptipennTester:
     def test_error_handling(self) -> TestResult:
         """Test application error handling"""
         test_name = "Error Handling"
-        self.logger.info(f"Starting {test_name}")
+        self._start_test(test_name)
         
         try:
             # Test 404 page
-            self.driver.get(f"{Config.APP_URL}/nonexistent-page")
-            time.sleep(2)
+            self._navigate(f"{Config.APP_URL}/nonexistent-page")
+            self._wait_ready(SELECTORS['error_elements'])
             error_404_screenshot = self.take_screenshot("16_error_404", "404 error page handling")
             
             # Check if proper error page is shown
-            error_elements = self.driver.find_elements(By.CSS_SELECTOR, 
-                ".error, .not-found, h1, h2")
-            
-            has_error_page = any("404" in elem.text or "not found" in elem.text.lower() 
-                               for elem in error_elements if elem.text)
+            error_page = self.driver.execute_script(_ERROR_PAGE_SCRIPT, SELECTORS['error_elements'])
+            error_elements_count = error_page['count']
+            has_error_page = error_page['has_error_page']
             
-            # Test network error simulation (invalid API call)
+            # Test network error simulation (invalid API call), awaited in-page instead of sleeping
             self.driver.execute_script("""
-                fetch('/api/invalid-endpoint')
-                .catch(err => console.error('Expected network error:', err));
+                return fetch('/api/invalid-endpoint')
+                    .then(response => response.status)
+                    .catch(err => console.error('Expected network error:', err));
             """)
-            time.sleep(2)
+            self._wait_for_console_event()
             
             # Check console for error handling
             console_errors = self.check_console_errors()
@@ -738,14 +1531,14 @@ class OptipennTester:
             performance = {
                 'has_error_page': has_error_page,
                 'console_errors': len(console_errors),
-                'error_elements_count': len(error_elements)
+                'error_elements_count': error_elements_count
             }
             
             # UX Score
             ux_score = 5
             if has_error_page:
                 ux_score += 3
-            if len(error_elements) > 0:
+            if error_elements_count > 0:
                 ux_score += 2
             ux_score = max(1, min(10, ux_score))
             
@@ -761,12 +1554,11 @@ class OptipennTester:
     def test_navigation_ux(self) -> TestResult:
         """Test overall navigation and UX flow"""
         test_name = "Navigation & UX Flow"
-        self.logger.info(f"Starting {test_name}")
+        self._start_test(test_name)
         
         try:
             # Go back to dashboard
-            self.driver.get(f"{Config.APP_URL}/")
-            time.sleep(2)
+            self._navigate(f"{Config.APP_URL}/")
             
             # Test navigation between all main sections
             navigation_flows = [
@@ -779,22 +1571,22 @@ class OptipennTester:
             nav_times = []
             for url, description in navigation_flows:
                 start_time = time.time()
-                self.driver.get(f"{Config.APP_URL}{url}")
+                self._navigate(f"{Config.APP_URL}{url}")
                 WebDriverWait(self.driver, Config.TIMEOUT).until(
-                    lambda driver: driver.execute_script("return document.readyState") == "complete"
+                    EC.presence_of_element_located((By.CSS_SELECTOR, SELECTORS['app_content']))
                 )
                 nav_time = time.time() - start_time
                 nav_times.append(nav_time)
                 
                 screenshot = self.take_screenshot(f"17_nav_{url.replace('/', '_')}", description)
             
-            # Test breadcrumbs or navigation indicators
-            nav_elements = self.driver.find_elements(By.CSS_SELECTOR, 
-                "nav, .breadcrumb, .navigation, .navbar")
-            
-            # Test global search if available
-            search_elements = self.driver.find_elements(By.CSS_SELECTOR, 
-                "[data-tour='global-search'], .global-search, input[placeholder*='Search']")
+            # Test breadcrumbs or navigation indicators, and global search if available
+            counts = self.count_elements({
+                'nav': SELECTORS['nav'],
+                'search': SELECTORS['global_search']
+            })
+            nav_elements_count = counts['nav']
+            search_elements_count = counts['search']
             
             # Performance analysis
             avg_nav_time = sum(nav_times) / len(nav_times) if nav_times else 0
@@ -802,8 +1594,8 @@ class OptipennTester:
             
             performance = {
                 'avg_navigation_time': round(avg_nav_time, 2),
-                'navigation_elements_count': len(nav_elements),
-                'global_search_available': len(search_elements) > 0,
+                'navigation_elements_count': nav_elements_count,
+                'global_search_available': search_elements_count > 0,
                 'console_errors': len(console_errors)
             }
             
@@ -813,9 +1605,9 @@ class OptipennTester:
                 ux_score += 2
             elif avg_nav_time > 3.0:
                 ux_score -= 2
-            if len(nav_elements) > 0:
+            if nav_elements_count > 0:
                 ux_score += 1
-            if len(search_elements) > 0:
+            if search_elements_count > 0:
                 ux_score += 1
             if console_errors:
                 ux_score -= len(console_errors)
@@ -831,285 +1623,97 @@ class OptipennTester:
             return TestResult(test_name, False, str(e), error_screenshot)
     
     def run_all_tests(self) -> List[TestResult]:
-        """Run all test modules"""
+        """Run all test modules in parallel, one browser per worker process"""
         self.logger.info("Starting comprehensive test suite for Optipenn CRM")
         
+        # Only the parent starts the server; workers find it already running
         if not self.start_application():
-            return [TestResult("Application Startup", False, "Failed to start application")]
-        
-        if not self.setup_browser():
-            return [TestResult("Browser Setup", False, "Failed to setup browser")]
+            return self._record_failure("Application Startup", "Failed to start application")
         
         try:
-            # Run all test modules
-            test_modules = [
-                self.test_login_flow,
-                self.test_dashboard,
-                self.test_clients_management,
-                self.test_quotes_functionality,
-                self.test_statistics_analytics,
-                self.test_error_handling,
-                self.test_navigation_ux
-            ]
-            
-            for test_module in test_modules:
-                try:
-                    result = test_module()
-                    self.test_results.append(result)
-                except Exception as e:
-                    self.logger.error(f"Test module {test_module.__name__} failed: {e}")
-                    self.test_results.append(TestResult(
-                        test_module.__name__, False, str(e), 
-                        self.take_screenshot(f"error_{test_module.__name__}", f"Module {test_module.__name__} crashed")
-                    ))
+            module_names = list(self.TEST_MODULES)
+            workers = max(1, min((os.cpu_count() or 1) - 2, len(module_names)))
+            self.logger.info(f"Running {len(module_names)} test modules across {workers} worker(s)")
+            
+            module_results: Dict[str, List[TestResult]] = {}
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+                futures = {pool.submit(_run_module, name, self.block_assets): name for name in module_names}
+                for future in as_completed(futures):
+                    name = futures[future]
+                    try:
+                        module_results[name] = future.result()
+                    except Exception as e:
+                        self.logger.error(f"Test module {self.TEST_MODULES[name]} failed: {e}")
+                        module_results[name] = [TestResult(self.TEST_MODULES[name], False, str(e))]
+            
+            # Report in suite order regardless of completion order
+            for name in module_names:
+                self.test_results.extend(module_results[name])
             
             return self.test_results
             
         finally:
             self.cleanup()
     
-    def run_specific_test(self, module_name: str) -> List[TestResult]:
-        """Run a specific test module"""
-        module_map = {
-            'login': self.test_login_flow,
-            'dashboard': self.test_dashboard,
-            'clients': self.test_clients_management,
-            'quotes': self.test_quotes_functionality,
-            'statistics': self.test_statistics_analytics,
-            'error': self.test_error_handling,
-            'navigation': self.test_navigation_ux
-        }
-        
-        if module_name not in module_map:
+    def run_specific_test(self, module_name: str, spawn_server: bool = True) -> List[TestResult]:
+        """Run a specific test module (spawn_server=False only waits for an already starting server)"""
+        if module_name not in self.TEST_MODULES:
             self.logger.error(f"Unknown test module: {module_name}")
-            return [TestResult("Invalid Module", False, f"Module '{module_name}' not found")]
+            return self._record_failure("Invalid Module", f"Module '{module_name}' not found")
         
         self.logger.info(f"Running specific test module: {module_name}")
         
-        if not self.start_application():
-            return [TestResult("Application Startup", False, "Failed to start application")]
+        if not self.start_application(spawn=spawn_server):
+            return self._record_failure("Application Startup", "Failed to start application")
         
         if not self.setup_browser():
-            return [TestResult("Browser Setup", False, "Failed to setup browser")]
+            return self._record_failure("Browser Setup", "Failed to setup browser")
         
         try:
-            result = module_map[module_name]()
+            if module_name != 'login' and not self.ensure_logged_in():
+                return self._record_failure("Login", "Could not establish an authenticated session")
+            
+            result = getattr(self, self.TEST_MODULES[module_name])()
             self.test_results.append(result)
             return self.test_results
             
         except Exception as e:
             self.logger.error(f"Specific test {module_name} failed: {e}")
-            return [TestResult(module_name, False, str(e))]
+            return self._record_failure(module_name, str(e))
         
         finally:
             self.cleanup()
     
+    def _record_failure(self, name: str, error: str) -> List[TestResult]:
+        """Record a run-level failure so the report and summary both include it"""
+        self.test_results.append(TestResult(name, False, error))
+        return self.test_results
+    
     def generate_html_report(self) -> str:
         """Generate comprehensive HTML report"""
-        total_tests = len(self.test_results)
-        passed_tests = sum(1 for result in self.test_results if result.passed)
-        failed_tests = total_tests - passed_tests
-        avg_ux_score = sum(result.ux_score for result in self.test_results) / total_tests if total_tests > 0 else 0
+        # Screenshots are copied into the report, so they must all be on disk first
+        self.flush_screenshots()
+        # One clock read so the header, file name and duration all agree
+        now = datetime.now()
+        self.stats = TestStats.from_results(self.test_results)
+        total_tests = self.stats.total
+        passed_tests = self.stats.passed
+        failed_tests = self.stats.failed
+        avg_ux_score = self.stats.avg_ux
         
-        total_duration = (datetime.now() - self.start_time).total_seconds()
+        shots_dir = Config.REPORT_DIR / "shots"
+        shots_dir.mkdir(exist_ok=True)
         
-        html_content = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Optipenn CRM - Automated Test Report</title>
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            margin: 0;
-            padding: 20px;
-            background-color: #f5f5f5;
-            color: #333;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 8px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            overflow: hidden;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 30px;
-            text-align: center;
-        }}
-        .header h1 {{
-            margin: 0;
-            font-size: 2.5em;
-            font-weight: 300;
-        }}
-        .header p {{
-            margin: 10px 0 0 0;
-            opacity: 0.9;
-        }}
-        .summary {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            padding: 30px;
-            background: #f8f9fa;
-        }}
-        .summary-card {{
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            text-align: center;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .summary-card h3 {{
-            margin: 0 0 10px 0;
-            color: #666;
-            font-size: 0.9em;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-        }}
-        .summary-card .value {{
-            font-size: 2em;
-            font-weight: bold;
-            margin: 0;
-        }}
-        .passed {{ color: #28a745; }}
-        .failed {{ color: #dc3545; }}
-        .ux-score {{ color: #17a2b8; }}
-        .duration {{ color: #6f42c1; }}
-        .test-results {{
-            padding: 30px;
-        }}
-        .test-result {{
-            margin-bottom: 30px;
-            border: 1px solid #e9ecef;
-            border-radius: 8px;
-            overflow: hidden;
-        }}
-        .test-result.passed {{
-            border-left: 4px solid #28a745;
-        }}
-        .test-result.failed {{
-            border-left: 4px solid #dc3545;
-        }}
-        .test-header {{
-            padding: 20px;
-            background: #f8f9fa;
-            border-bottom: 1px solid #e9ecef;
-        }}
-        .test-header h3 {{
-            margin: 0;
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-        }}
-        .test-status {{
-            font-size: 0.8em;
-            padding: 4px 12px;
-            border-radius: 20px;
-            color: white;
-            font-weight: bold;
-        }}
-        .test-status.passed {{
-            background: #28a745;
-        }}
-        .test-status.failed {{
-            background: #dc3545;
-        }}
-        .test-content {{
-            padding: 20px;
-        }}
-        .test-details {{
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 20px;
-            margin-bottom: 20px;
-        }}
-        .test-info {{
-            background: #f8f9fa;
-            padding: 15px;
-            border-radius: 6px;
-        }}
-        .test-info h4 {{
-            margin: 0 0 10px 0;
-            color: #666;
-            font-size: 0.9em;
-        }}
-        .screenshot {{
-            text-align: center;
-            margin-top: 20px;
-        }}
-        .screenshot img {{
-            max-width: 100%;
-            height: auto;
-            border-radius: 6px;
-            border: 1px solid #e9ecef;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        }}
-        .error-message {{
-            background: #f8d7da;
-            color: #721c24;
-            padding: 15px;
-            border-radius: 6px;
-            margin-top: 15px;
-            border: 1px solid #f5c6cb;
-        }}
-        .performance-metrics {{
-            background: #e1f5fe;
-            padding: 15px;
-            border-radius: 6px;
-            margin-top: 15px;
-        }}
-        .performance-metrics h4 {{
-            margin: 0 0 10px 0;
-            color: #01579b;
-        }}
-        .metric {{
-            margin: 5px 0;
-        }}
-        .recommendations {{
-            background: #fff3cd;
-            border: 1px solid #ffeaa7;
-            padding: 20px;
-            margin: 30px;
-            border-radius: 8px;
-        }}
-        .recommendations h3 {{
-            margin: 0 0 15px 0;
-            color: #856404;
-        }}
-        .rec-list {{
-            list-style-type: none;
-            padding: 0;
-        }}
-        .rec-list li {{
-            padding: 8px 0;
-            border-bottom: 1px solid #ffeaa7;
-        }}
-        .rec-list li:last-child {{
-            border-bottom: none;
-        }}
-        .footer {{
-            text-align: center;
-            padding: 20px;
-            background: #f8f9fa;
-            color: #666;
-            font-size: 0.9em;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>Optipenn CRM - Test Report</h1>
-            <p>Comprehensive Automated Testing Results</p>
-            <p>Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-        </div>
+        # A single --module result needs no summary grid or recommendations
+        if total_tests == 1:
+            return self._generate_single_html(self.test_results[0], shots_dir, now)
+        
+        total_duration = (now - self.start_time).total_seconds()
         
+        parts: List[str] = [
+            _REPORT_HEAD_CSS,
+            _REPORT_HEADER_TMPL.format(ts=now.strftime('%Y-%m-%d %H:%M:%S')),
+            f"""
         <div class="summary">
             <div class="summary-card">
                 <h3>Total Tests</h3>
@@ -1136,78 +1740,9 @@ class OptipennTester:
         <div class="test-results">
             <h2>Test Results Details</h2>
         """
+        ]
         
-        for result in self.test_results:
-            status_class = "passed" if result.passed else "failed"
-            status_text = "PASSED" if result.passed else "FAILED"
-            
-            # Convert screenshot path to base64 for embedding
-            screenshot_html = ""
-            if result.screenshot and os.path.exists(result.screenshot):
-                try:
-                    with open(result.screenshot, "rb") as img_file:
-                        img_data = base64.b64encode(img_file.read()).decode()
-                        screenshot_html = f"""
-                        <div class="screenshot">
-                            <h4>Screenshot</h4>
-                            <img src="data:image/png;base64,{img_data}" alt="Test Screenshot">
-                        </div>
-                        """
-                except Exception as e:
-                    screenshot_html = f"<p>Screenshot error: {e}</p>"
-            
-            # Performance metrics HTML
-            perf_html = ""
-            if result.performance:
-                metrics_html = ""
-                for key, value in result.performance.items():
-                    metrics_html += f'<div class="metric"><strong>{key.replace("_", " ").title()}:</strong> {value}</div>'
-                
-                perf_html = f"""
-                <div class="performance-metrics">
-                    <h4>Performance Metrics</h4>
-                    {metrics_html}
-                </div>
-                """
-            
-            # Error message HTML
-            error_html = ""
-            if result.error:
-                error_html = f"""
-                <div class="error-message">
-                    <strong>Error:</strong> {result.error}
-                </div>
-                """
-            
-            html_content += f"""
-            <div class="test-result {status_class}">
-                <div class="test-header">
-                    <h3>
-                        {result.name}
-                        <span class="test-status {status_class}">{status_text}</span>
-                    </h3>
-                </div>
-                <div class="test-content">
-                    <div class="test-details">
-                        <div class="test-info">
-                            <h4>Test Information</h4>
-                            <div class="metric"><strong>Timestamp:</strong> {result.timestamp.strftime('%H:%M:%S')}</div>
-                            <div class="metric"><strong>UX Score:</strong> {result.ux_score}/10</div>
-                            <div class="metric"><strong>Status:</strong> {status_text}</div>
-                        </div>
-                        <div class="test-info">
-                            <h4>Assessment</h4>
-                            <div class="metric"><strong>Visual Appeal:</strong> {'Good' if result.ux_score >= 7 else 'Needs Improvement' if result.ux_score >= 4 else 'Poor'}</div>
-                            <div class="metric"><strong>Functionality:</strong> {'Working' if result.passed else 'Issues Found'}</div>
-                            <div class="metric"><strong>B2B Ready:</strong> {'Yes' if result.ux_score >= 6 and result.passed else 'Needs Work'}</div>
-                        </div>
-                    </div>
-                    {error_html}
-                    {perf_html}
-                    {screenshot_html}
-                </div>
-            </div>
-            """
+        parts.extend(self._render_result_fragment(result, shots_dir) for result in self.test_results)
         
         # Generate recommendations
         recommendations = []
@@ -1218,15 +1753,20 @@ class OptipennTester:
         if failed_tests > 0:
             recommendations.append(f"Fix {failed_tests} failing test(s) to ensure application stability")
         
+        # Slow pages and console errors, counted in a single pass
+        slow_count = console_err_count = 0
+        for r in self.test_results:
+            performance = r.performance or {}
+            slow_count += performance.get('load_time', 0) > Config.MIN_LOAD_TIME
+            console_err_count += performance.get('console_errors', 0) > 0
+        
         # Performance-based recommendations
-        slow_tests = [r for r in self.test_results if r.performance.get('load_time', 0) > Config.MIN_LOAD_TIME]
-        if slow_tests:
-            recommendations.append(f"Optimize page load times - {len(slow_tests)} pages are loading slower than {Config.MIN_LOAD_TIME}s")
+        if slow_count:
+            recommendations.append(f"Optimize page load times - {slow_count} pages are loading slower than {Config.MIN_LOAD_TIME}s")
         
         # Console error recommendations
-        console_error_tests = [r for r in self.test_results if r.performance.get('console_errors', 0) > 0]
-        if console_error_tests:
-            recommendations.append(f"Fix JavaScript console errors found in {len(console_error_tests)} test(s)")
+        if console_err_count:
+            recommendations.append(f"Fix JavaScript console errors found in {console_err_count} test(s)")
         
         if avg_ux_score >= 8 and failed_tests == 0:
             recommendations.append("Excellent! Consider adding dark mode for premium professional appearance")
@@ -1234,7 +1774,7 @@ class OptipennTester:
         
         rec_html = ""
         if recommendations:
-            rec_items = "".join([f"<li>{rec}</li>" for rec in recommendations])
+            rec_items = "".join(f"<li>{html.escape(rec)}</li>" for rec in recommendations)
             rec_html = f"""
             <div class="recommendations">
                 <h3>UX Recommendations for Enterprise Users</h3>
@@ -1244,24 +1784,106 @@ class OptipennTester:
             </div>
             """
         
-        html_content += f"""
-        </div>
+        parts.append(_REPORT_FOOTER_TMPL.format(recommendations=rec_html))
+        return self._write_report(parts, now)
+    
+    def _render_result_fragment(self, result: TestResult, shots_dir: Path) -> str:
+        """Render one test result as a report fragment, copying its screenshot into shots_dir"""
+        status_class = "passed" if result.passed else "failed"
+        status_text = "PASSED" if result.passed else "FAILED"
         
-        {rec_html}
+        # Copy the screenshot next to the report and link it rather than inlining it as base64
+        screenshot_html = ""
+        # take_screenshot returns "" on failure, so a path is trusted; a missing file
+        # (e.g. a failed background write) simply gets no screenshot block
+        if result.screenshot:
+            try:
+                shot_name = Path(result.screenshot).name
+                shutil.copy(result.screenshot, shots_dir / shot_name)
+                screenshot_html = f"""
+                    <div class="screenshot">
+                        <h4>Screenshot</h4>
+                        <img src="{shots_dir.name}/{shot_name}" alt="Test Screenshot" loading="lazy">
+                    </div>
+                    """
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                screenshot_html = f"<p>Screenshot error: {html.escape(str(e))}</p>"
         
-        <div class="footer">
-            <p>Report generated by Optipenn CRM Automated Test Suite</p>
-            <p>For technical support and UX improvements, review the detailed logs and screenshots above</p>
+        # Performance metrics HTML
+        perf_html = ""
+        if result.performance:
+            metrics_html = "".join(
+                f'<div class="metric"><strong>{key.replace("_", " ").title()}:</strong> {html.escape(str(value))}</div>'
+                for key, value in result.performance.items()
+            )
+            
+            perf_html = f"""
+            <div class="performance-metrics">
+                <h4>Performance Metrics</h4>
+                {metrics_html}
+            </div>
+            """
+        
+        # Error message HTML
+        error_html = ""
+        if result.error:
+            error_html = f"""
+            <div class="error-message">
+                <strong>Error:</strong> {html.escape(result.error)}
+            </div>
+            """
+        
+        return f"""
+        <div class="test-result {status_class}">
+            <div class="test-header">
+                <h3>
+                    {html.escape(result.name)}
+                    <span class="test-status {status_class}">{status_text}</span>
+                </h3>
+            </div>
+            <div class="test-content">
+                <div class="test-details">
+                    <div class="test-info">
+                        <h4>Test Information</h4>
+                        <div class="metric"><strong>Timestamp:</strong> {result.timestamp.strftime('%H:%M:%S')}</div>
+                        <div class="metric"><strong>UX Score:</strong> {result.ux_score}/10</div>
+                        <div class="metric"><strong>Status:</strong> {status_text}</div>
+                    </div>
+                    <div class="test-info">
+                        <h4>Assessment</h4>
+                        <div class="metric"><strong>Visual Appeal:</strong> {'Good' if result.ux_score >= 7 else 'Needs Improvement' if result.ux_score >= 4 else 'Poor'}</div>
+                        <div class="metric"><strong>Functionality:</strong> {'Working' if result.passed else 'Issues Found'}</div>
+                        <div class="metric"><strong>B2B Ready:</strong> {'Yes' if result.ux_score >= 6 and result.passed else 'Needs Work'}</div>
+                    </div>
+                </div>
+                {error_html}
+                {perf_html}
+                {screenshot_html}
+            </div>
         </div>
-    </div>
-</body>
-</html>
         """
-        
-        # Save report
-        report_file = Config.REPORT_DIR / f"test_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
-        with open(report_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+    
+    def _generate_single_html(self, result: TestResult, shots_dir: Path, now: datetime) -> str:
+        """Minimal report for a single-module run: no summary grid or recommendations"""
+        return self._write_report([
+            _REPORT_HEAD_CSS,
+            _REPORT_HEADER_TMPL.format(ts=now.strftime('%Y-%m-%d %H:%M:%S')),
+            """
+        <div class="test-results">
+            <h2>Test Result Details</h2>
+        """,
+            self._render_result_fragment(result, shots_dir),
+            _REPORT_FOOTER_TMPL.format(recommendations="")
+        ], now)
+    
+    def _write_report(self, parts: List[str], now: datetime) -> str:
+        """Write the report fragments to a file named after the report timestamp and return its path"""
+        report_file = Config.REPORT_DIR / f"test_report_{now.strftime('%Y%m%d_%H%M%S')}.html"
+        # A 1MB buffer batches the small fragments into a handful of write syscalls
+        with open(report_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.writelines(parts)
         
         self.logger.info(f"HTML report generated: {report_file}")
         return str(report_file)
@@ -1269,30 +1891,52 @@ class OptipennTester:
     def cleanup(self):
         """Clean up resources"""
         try:
-            if self.driver:
-                self.driver.quit()
-                self.logger.info("Browser closed")
+            self._http.close()
+            self._shot_pool.shutdown(wait=True)
+            self._pending_shots = []
             
-            # Cleanup browser data directory
-            if self.user_data_dir and self.user_data_dir.exists():
+            if self.driver:
+                driver, self.driver = self.driver, None
+                if self.reuse_driver:
+                    self._stash_driver(driver)
+                else:
+                    driver.quit()
+                    self.logger.info("Browser closed")
+            
+            if self._profile_dir:
+                profile_dir, self._profile_dir = self._profile_dir, None
                 try:
-                    import shutil
-                    shutil.rmtree(self.user_data_dir)
-                    self.logger.info("Browser data directory cleaned up")
-                except Exception as e:
-                    self.logger.warn(f"Could not cleanup browser data directory: {e}")
+                    profile_dir.cleanup()
+                except OSError as e:
+                    self.logger.warning(f"Could not cleanup browser profile directory: {e}")
             
             if self.server_process:
-                self.server_process.terminate()
+                # SIGTERM the group, up to 1s for npm to exit cleanly, then SIGKILL whatever
+                # is left (including node grandchildren that outlived npm)
+                self._signal_server_group(force=False)
+                for _ in range(5):
+                    if self.server_process.poll() is not None:
+                        break
+                    time.sleep(0.2)
+                self._signal_server_group(force=True)
                 try:
-                    self.server_process.wait(timeout=10)
+                    self.server_process.wait(timeout=0.5)
                 except subprocess.TimeoutExpired:
-                    self.server_process.kill()
+                    self.logger.warning("Server process did not exit after SIGKILL")
+                self.server_process = None
                 self.logger.info("Server process terminated")
                 
         except Exception as e:
             self.logger.error(f"Cleanup error: {e}")
 
+def _run_module(module_name: str, block_assets: bool = False) -> List[TestResult]:
+    """Worker entry point: run one module with its own tester and browser against the parent's server"""
+    tester = OptipennTester(block_assets=block_assets, artifact_tag=module_name)
+    try:
+        return tester.run_specific_test(module_name, spawn_server=False)
+    finally:
+        tester.cleanup()
+
 def main():
     """Main execution function"""
     parser = argparse.ArgumentParser(
@@ -1308,6 +1952,9 @@ Examples:
   python test_optipenn_app.py --module statistics # Test only statistics/analytics
   python test_optipenn_app.py --module navigation # Test only navigation UX
   python test_optipenn_app.py --module error     # Test only error handling
+  python test_optipenn_app.py --no-images        # Skip image/font downloads in structural tests
+  OPTIPENN_REUSE_DRIVER=1 python test_optipenn_app.py --module login  # Keep Chrome running for the next --module run
+  python test_optipenn_app.py --kill-driver      # Close the Chrome kept running by OPTIPENN_REUSE_DRIVER
         """
     )
     
@@ -1318,14 +1965,34 @@ Examples:
         choices=['login', 'dashboard', 'clients', 'quotes', 'statistics', 'navigation', 'error']
     )
     
+    parser.add_argument(
+        '--no-images',
+        action='store_true',
+        help='Block image and font downloads during the clients and quotes structural tests'
+    )
+    
+    parser.add_argument(
+        '--kill-driver',
+        action='store_true',
+        help='Close the browser kept running by OPTIPENN_REUSE_DRIVER=1 and exit'
+    )
+    
     args = parser.parse_args()
     
+    if args.kill_driver:
+        tester = OptipennTester()
+        closed = tester.kill_stashed_driver()
+        tester.cleanup()
+        print("Stashed browser closed" if closed else "No stashed browser to close")
+        return 0
+    
     print("🚀 Optipenn CRM - Comprehensive Automated Test Suite")
     print("=" * 60)
     print("Testing B2B Enterprise UX, Functionality, and Performance")
     print()
     
-    tester = OptipennTester()
+    # Reuse only applies to single-module runs; the full suite gives each worker its own browser
+    tester = OptipennTester(block_assets=args.no_images, reuse_driver=Config.REUSE_DRIVER and bool(args.module))
     
     try:
         if args.module:
@@ -1343,10 +2010,11 @@ Examples:
         print("TEST SUMMARY")
         print("=" * 60)
         
-        total_tests = len(results)
-        passed_tests = sum(1 for r in results if r.passed)
-        failed_tests = total_tests - passed_tests
-        avg_ux_score = sum(r.ux_score for r in results) / total_tests if total_tests > 0 else 0
+        stats = tester.stats
+        total_tests = stats.total
+        passed_tests = stats.passed
+        failed_tests = stats.failed
+        avg_ux_score = stats.avg_ux
         
         print(f"Total Tests: {total_tests}")
         print(f"Passed: {passed_tests}")
@@ -1387,5 +2055,56 @@ Examples:
     finally:
         tester.cleanup()
 
+# Parallel entry point: `pytest test_optipenn_app.py -n auto` gives every xdist worker
+# its own Chrome driver, workers share one login through the persisted cookies, and the
+# controller process starts and stops the server (conftest.py)
+if pytest is not None:
+    
+    @pytest.fixture(scope="session")
+    def tester(request):
+        """Per-worker tester with its own browser; the server belongs to the controller (conftest.py)"""
+        worker_id = getattr(request.config, 'workerinput', {}).get('workerid', '')
+        instance = OptipennTester(artifact_tag=worker_id)
+        try:
+            if not instance.start_application(spawn=False):
+                pytest.fail("Failed to start application")
+            if not instance.setup_browser():
+                pytest.fail("Failed to setup browser")
+            yield instance
+        finally:
+            instance.cleanup()
+    
+    @pytest.fixture(scope="session")
+    def authenticated_tester(tester):
+        """Tester with a logged-in browser session, reusing persisted cookies when still valid"""
+        if not tester.ensure_logged_in():
+            pytest.fail("Could not establish an authenticated session")
+        return tester
+    
+    def _check(result: TestResult):
+        assert result.passed, result.error
+    
+    def test_login_flow(tester):
+        tester.driver.delete_all_cookies()
+        _check(tester.test_login_flow())
+    
+    def test_dashboard(authenticated_tester):
+        _check(authenticated_tester.test_dashboard())
+    
+    def test_clients_management(authenticated_tester):
+        _check(authenticated_tester.test_clients_management())
+    
+    def test_quotes_functionality(authenticated_tester):
+        _check(authenticated_tester.test_quotes_functionality())
+    
+    def test_statistics_analytics(authenticated_tester):
+        _check(authenticated_tester.test_statistics_analytics())
+    
+    def test_error_handling(authenticated_tester):
+        _check(authenticated_tester.test_error_handling())
+    
+    def test_navigation_ux(authenticated_tester):
+        _check(authenticated_tester.test_navigation_ux())
+
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file